@@ -11,6 +11,24 @@ import os
 import shutil
 from collections import defaultdict
 
+# Characters (besides alphanumerics) that are kept when turning a prefix into
+# a directory name; anything else is replaced with '_'.
+_PREFIX_SAFE_CHARS = frozenset(" _-")
+
+def _entry_is_file(entry):
+    """Like os.path.isfile for an os.DirEntry: False instead of raising OSError."""
+    try:
+        return entry.is_file()
+    except OSError: # e.g. symlink loops or targets that cannot be stat'ed
+        return False
+
+def _entry_is_dir(entry):
+    """Like os.path.isdir for an os.DirEntry: False instead of raising OSError."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
 def get_organization_plan(directory, separator='-'):
     """
     Analyzes files in a directory and groups them by prefix.
@@ -31,7 +49,8 @@ def get_organization_plan(directory, separator='-'):
     if not os.path.isdir(directory):
         raise FileNotFoundError(f"Directory not found: {directory}")
 
-    files = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
+    with os.scandir(directory) as entries:
+        files = [entry.name for entry in entries if _entry_is_file(entry)]
     
     categories = defaultdict(list)
     for file in files:
@@ -44,7 +63,7 @@ def get_organization_plan(directory, separator='-'):
         # Replace or remove characters invalid for directory names
         # This is a basic example; more robust sanitization might be needed
         # depending on target filesystems.
-        prefix = "".join(c if c.isalnum() or c in [' ', '_', '-'] else '_' for c in prefix).strip()
+        prefix = "".join(c if c.isalnum() or c in _PREFIX_SAFE_CHARS else '_' for c in prefix).strip()
         if not prefix: # If prefix becomes empty after sanitization
             prefix = "UNNAMED_CATEGORY"
 
@@ -79,12 +98,15 @@ def execute_organization(directory, categories, remove_prefix=False, separator='
     
     for category, files_in_cat in categories.items(): # Renamed 'files' to 'files_in_cat'
         category_dir = os.path.join(directory, category)
-        if not os.path.exists(category_dir):
-            try:
-                os.makedirs(category_dir)
-            except OSError as e:
-                errors.append(f"Could not create directory '{category_dir}': {e}")
-                continue # Skip this category if directory creation fails
+        try:
+            # Categories are always direct children of 'directory', so a single
+            # mkdir is enough; no need to walk the parents like makedirs does.
+            os.mkdir(category_dir)
+        except FileExistsError:
+            pass
+        except OSError as e:
+            errors.append(f"Could not create directory '{category_dir}': {e}")
+            continue # Skip this category if directory creation fails
         
         for file_item in files_in_cat: # Renamed 'file' to 'file_item'
             src = os.path.join(directory, file_item)
@@ -115,6 +137,30 @@ def execute_organization(directory, categories, remove_prefix=False, separator='
     return moved_count, len(categories), errors
 
 
+def scan_organized_categories(directory):
+    """
+    Scans the subdirectories of a directory and lists the files in each.
+
+    The result can be filtered and passed to `reverse_organization_action`.
+
+    Args:
+        directory (str): The main directory containing category subdirectories.
+
+    Returns:
+        dict: A dictionary where keys are subdirectory names and values are
+              lists of filenames directly inside them (possibly empty).
+    """
+    organized_categories = {}
+    with os.scandir(directory) as entries:
+        subdirs = [entry for entry in entries if _entry_is_dir(entry)]
+    
+    for subdir in subdirs:
+        with os.scandir(subdir.path) as entries:
+            organized_categories[subdir.name] = [entry.name for entry in entries if _entry_is_file(entry)]
+    
+    return organized_categories
+
+
 def reverse_organization_action(directory, organized_categories, remove_prefix_on_organize, separator_on_organize):
     """
     Reverses a previous file organization.
@@ -127,7 +173,7 @@ def reverse_organization_action(directory, organized_categories, remove_prefix_o
         directory (str): The main directory where subdirectories were created.
         organized_categories (dict): A dictionary where keys are subdirectory names (original categories)
                                      and values are lists of files currently in those subdirectories.
-                                     This can be generated by scanning the subdirectories.
+                                     This can be generated with `scan_organized_categories`.
         remove_prefix_on_organize (bool): Indicates if prefixes were removed during the
                                           original organization.
         separator_on_organize (str): The separator used during the original organization.
@@ -215,7 +261,7 @@ def generate_directory_tree(directory, output_file=None, show_hidden=False, max_
     if not os.path.isdir(directory):
         raise FileNotFoundError(f"Directory not found: {directory}")
 
-    def _build_tree(path, prefix="", depth=0, is_last=True):
+    def _build_tree(path, prefix="", depth=0, is_last=True, is_dir=True):
         """Recursively builds the tree structure."""
         if max_depth is not None and depth > max_depth:
             return []
@@ -227,21 +273,21 @@ def generate_directory_tree(directory, output_file=None, show_hidden=False, max_
             lines.append(f"{base_name}/\n")
         else:
             connector = "└── " if is_last else "├── "
-            lines.append(f"{prefix}{connector}{base_name}{'/' if os.path.isdir(path) else ''}\n")
+            lines.append(f"{prefix}{connector}{base_name}{'/' if is_dir else ''}\n")
         
-        if os.path.isdir(path):
+        if is_dir:
             try:
-                items = os.listdir(path)
-                if not show_hidden:
-                    items = [item for item in items if not item.startswith('.')]
+                # scandir reports the entry type along with the name, so there
+                # is no separate stat call per child
+                with os.scandir(path) as it:
+                    entries = [entry for entry in it if show_hidden or not entry.name.startswith('.')]
                 
                 # Sort: directories first, then files, both alphabetically
-                dirs = [item for item in items if os.path.isdir(os.path.join(path, item))]
-                files = [item for item in items if os.path.isfile(os.path.join(path, item))]
-                sorted_items = sorted(dirs) + sorted(files)
+                dirs = [entry for entry in entries if _entry_is_dir(entry)]
+                files = [entry for entry in entries if _entry_is_file(entry)]
+                sorted_items = sorted(dirs, key=lambda entry: entry.name) + sorted(files, key=lambda entry: entry.name)
                 
-                for i, item in enumerate(sorted_items):
-                    item_path = os.path.join(path, item)
+                for i, entry in enumerate(sorted_items):
                     is_last_item = (i == len(sorted_items) - 1)
                     
                     if depth == 0:
@@ -249,7 +295,8 @@ def generate_directory_tree(directory, output_file=None, show_hidden=False, max_
                     else:
                         next_prefix = prefix + ("    " if is_last else "│   ")
                     
-                    lines.extend(_build_tree(item_path, next_prefix, depth + 1, is_last_item))
+                    is_dir_item = (i < len(dirs)) # Directories are sorted first
+                    lines.extend(_build_tree(entry.path, next_prefix, depth + 1, is_last_item, is_dir_item))
                     
             except PermissionError:
                 if depth > 0:
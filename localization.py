@@ -4,10 +4,66 @@ Manages internationalization (i18n) for the application.
 Loads language strings from JSON files, detects system language,
 and provides a mechanism to retrieve translated strings.
 """
+import functools
 import json
 import locale
 import os
 import sys
+import types
+
+try:
+    import orjson # Optional: faster parsing of locale files if installed
+except ImportError:
+    orjson = None
+
+def _loads(text):
+    """
+    Parses a JSON document, using orjson when it is available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+    need to handle the standard library exception.
+
+    Args:
+        text (str | bytes): The JSON document to parse.
+
+    Returns:
+        The parsed JSON value.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+# Roughly twice the number of shipped locales, so entries left behind by
+# edited files (new mtime) are eventually evicted.
+_LOCALE_CACHE_SIZE = 32
+
+@functools.lru_cache(maxsize=_LOCALE_CACHE_SIZE)
+def _parse_locale_file(filepath, mtime_ns):
+    """Parses a locale file; cached per (path, modification time)."""
+    # Locale files are small, so read the raw bytes in one unbuffered call and
+    # let the JSON parser decode them (UTF-8) instead of going through a text wrapper
+    with open(filepath, 'rb', buffering=0) as f:
+        data = _loads(f.read())
+    if isinstance(data, dict): # Shared between callers, so hand out a read-only view
+        data = types.MappingProxyType(data)
+    return data
+
+def _read_locale_file(filepath):
+    """
+    Returns the parsed contents of a locale JSON file.
+
+    Results are cached and shared between LocaleManager instances, so a
+    JSON object is returned as a read-only mapping. The file's modification
+    time is part of the cache key, so an edited file is parsed again on the
+    next read.
+
+    Args:
+        filepath (str): Path to the locale JSON file.
+
+    Returns:
+        The parsed JSON value (a types.MappingProxyType for JSON objects).
+    """
+    return _parse_locale_file(filepath, os.stat(filepath).st_mtime_ns)
 
 class LocaleManager:
     """
@@ -54,10 +110,9 @@ class LocaleManager:
                 if filename.endswith(".json"):
                     lang_code = filename[:-5]
                     try:
-                        with open(os.path.join(self.locales_dir, filename), 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            lang_name = data.get("_lang_name_", lang_code) # Expecting a _lang_name_ key in json
-                            langs[lang_code] = lang_name
+                        data = _read_locale_file(os.path.join(self.locales_dir, filename))
+                        lang_name = data.get("_lang_name_", lang_code) # Expecting a _lang_name_ key in json
+                        langs[lang_code] = lang_name
                     except Exception as e:
                         print(f"Warning: Could not load language file {filename}: {e}", file=sys.stderr)
             if not langs: # If no languages loaded, ensure default is somewhat available
@@ -72,15 +127,15 @@ class LocaleManager:
         Loads the translation strings for the given language code.
 
         If the specified language file is not found or is invalid,
-        it attempts to fall back to the default language.
+        it attempts to fall back to the default language. Unchanged files
+        that were already parsed are served from the locale file cache.
 
         Args:
             lang_code (str): The language code (e.g., "en", "tr") to load.
         """
         filepath = os.path.join(self.locales_dir, f"{lang_code}.json")
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                self.translations = json.load(f)
+            self.translations = _read_locale_file(filepath)
         except FileNotFoundError:
             print(f"Warning: Language file not found: {filepath}. Falling back to default.", file=sys.stderr)
             if lang_code != self.default_lang:
@@ -95,7 +150,10 @@ class LocaleManager:
                 self.translations = {}
         except Exception as e:
             print(f"Error loading language {lang_code}: {e}", file=sys.stderr)
-            self.translations = {}
+            if lang_code != self.default_lang:
+                self.load_language(self.default_lang)
+            else:
+                self.translations = {}
 
 
     def set_language(self, lang_code):
@@ -137,6 +195,8 @@ class LocaleManager:
                  or the key if no translation is found.
         """
         val = self.translations.get(key, key) # Return key if not found
+        if not kwargs: # Nothing to substitute, skip parsing the format string
+            return val
         try:
             return val.format(**kwargs)
         except KeyError as e: # Missing a format key
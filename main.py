@@ -16,7 +16,7 @@ if project_dir not in sys.path:
 # Moved imports here to be available for the main() function
 import tkinter as tk
 from gui_organizer import FileOrganizerApp
-from file_organizer import get_organization_plan, execute_organization, reverse_organization_action, generate_directory_tree
+from file_organizer import get_organization_plan, execute_organization, reverse_organization_action, generate_directory_tree, scan_organized_categories
 
 def handle_cli_mode(args):
     """
@@ -54,26 +54,20 @@ def handle_cli_mode(args):
             print(f"Scanning subdirectories in {args.directory}...")
             
             # Build organized categories from existing subdirectories
-            organized_categories = {}
-            subdirs = [d for d in os.listdir(args.directory) 
-                      if os.path.isdir(os.path.join(args.directory, d))]
+            scanned = scan_organized_categories(args.directory)
             
-            if not subdirs:
+            if not scanned:
                 print("No subdirectories found to reverse organization.")
                 return 1
                 
-            for subdir in subdirs:
-                subdir_path = os.path.join(args.directory, subdir)
-                files = [f for f in os.listdir(subdir_path) 
-                        if os.path.isfile(os.path.join(subdir_path, f))]
-                if files:
-                    organized_categories[subdir] = files
+            organized_categories = {subdir: files for subdir, files in scanned.items() if files}
             
             if not organized_categories:
                 print("No files found in subdirectories to move back.")
                 return 1
                 
-            print(f"Found {sum(len(files) for files in organized_categories.values())} files in "
+            file_count = sum(len(files) for files in organized_categories.values())
+            print(f"Found {file_count} files in "
                   f"{len(organized_categories)} subdirectories.")
                   
             if not args.yes and input("Proceed with reversal? (y/n): ").lower() != 'y':
@@ -92,7 +86,7 @@ def handle_cli_mode(args):
                     print(f"  - {error}")
                 if len(errors) > 5:
                     print(f"  - ... and {len(errors)-5} more errors.")
-                return 1 if len(errors) == sum(len(files) for files in organized_categories.values()) else 0
+                return 1 if len(errors) == file_count else 0
                 
         else:
             # Handle forward organization
@@ -140,13 +134,12 @@ def handle_cli_mode(args):
         print(f"Error: {str(e)}")
         return 1
 
-def main():
+def _build_parser():
     """
-    Initializes and runs the File Organizer Application.
-    This function serves as the entry point for both direct execution 
-    and when installed via pip/setup.py.
-    
-    Determines whether to run in GUI or CLI mode based on command-line arguments.
+    Builds the command-line argument parser.
+
+    Returns:
+        argparse.ArgumentParser: The configured parser.
     """
     parser = argparse.ArgumentParser(description='File Organizer Tool - Organize files into subdirectories based on filename prefixes.')
     parser.add_argument('directory', nargs='?', help='Directory containing files to organize (if not specified, GUI mode is launched)')
@@ -159,8 +152,29 @@ def main():
     parser.add_argument('--output', help='Output file for directory tree export')
     parser.add_argument('--show-hidden', action='store_true', help='Include hidden files and directories in directory tree')
     parser.add_argument('--max-depth', type=int, help='Maximum depth for directory tree generation')
+    return parser
+
+# Built once at import so repeated main() calls share the same parser
+_PARSER = _build_parser()
+
+def main(args=None):
+    """
+    Initializes and runs the File Organizer Application.
+    This function serves as the entry point for both direct execution 
+    and when installed via pip/setup.py.
     
-    args = parser.parse_args()
+    Determines whether to run in GUI or CLI mode based on command-line arguments.
+
+    Args:
+        args (argparse.Namespace, optional): Pre-parsed arguments. If None,
+                                             arguments are parsed from sys.argv.
+                                             Defaults to None.
+
+    Returns:
+        int: Exit code (0 for success, non-zero for error)
+    """
+    if args is None:
+        args = _PARSER.parse_args()
     
     # If directory is provided, run in CLI mode
     if args.directory: